@@ -7,93 +7,263 @@ cloud components and their relationships, then displays it in a web browser.
 
 Requirements:
 - matplotlib
-- networkx
 - plotly (for interactive web visualization)
 
 Usage:
     python cloud_architecture_viz.py
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import networkx as nx
-import plotly.graph_objects as go
-import plotly.offline as pyo
+import numpy as np
+import argparse
+import functools
 import webbrowser
 import tempfile
-import os
+import hashlib
+import json
+import pathlib
 from datetime import datetime
+from string import Template
+
+# Output locations, resolved once and independent of the working
+# directory the script is launched from
+DOCS_DIR = pathlib.Path(__file__).parent / 'docs'
+HTML_FILE = DOCS_DIR / 'index.html'
+CACHE_FILE = DOCS_DIR / '.viz_cache.json'
+STATIC_FILE = pathlib.Path(tempfile.gettempdir()) / 'cloud_architecture_static.png'
+
+# Directories already confirmed to exist this run (saves a syscall on
+# every call after the first)
+_dirs_ready = set()
+
+# Colors for different components
+COLORS = {
+    'user': '#4CAF50',
+    'web': '#2196F3',
+    'app': '#FF9800',
+    'db': '#9C27B0',
+    'cache': '#F44336',
+    'storage': '#795548',
+    'network': '#607D8B'
+}
+
+# Components definition
+COMPONENTS = [
+    # (x, y, width, height, label, color_key)
+    (1, 0.2, 1.2, 0.6, 'Users', 'user'),
+    (1, 5.5, 1.5, 0.8, 'Load Balancer', 'network'),
+    (3.5, 6, 1.5, 0.6, 'Web Server 1', 'web'),
+    (3.5, 5, 1.5, 0.6, 'Web Server 2', 'web'),
+    (6, 5.5, 1.5, 0.8, 'App Server', 'app'),
+    (8, 6, 1.2, 0.6, 'Database', 'db'),
+    (8, 4.5, 1.2, 0.6, 'Redis Cache', 'cache'),
+    (6, 3, 1.5, 0.8, 'File Storage', 'storage'),
+    (3.5, 2, 1.5, 0.6, 'API Gateway', 'network'),
+    (1, 2.5, 1.5, 0.6, 'CDN', 'network')
+]
+
+# Connections between components
+CONNECTIONS = [
+    # (start_x, start_y, end_x, end_y)
+    (1.6, 0.8, 1.7, 5.5),  # Users to Load Balancer
+    (2.5, 5.9, 3.5, 6.2),  # Load Balancer to Web Server 1
+    (2.5, 5.7, 3.5, 5.2),  # Load Balancer to Web Server 2
+    (5, 6.2, 6, 5.9),      # Web Server 1 to App Server
+    (5, 5.2, 6, 5.7),      # Web Server 2 to App Server
+    (7.5, 5.9, 8, 6.2),    # App Server to Database
+    (7.5, 5.7, 8, 4.9),    # App Server to Redis
+    (6.7, 5.5, 6.7, 3.8),  # App Server to File Storage
+    (1.6, 0.8, 3.5, 2.2),  # Users to API Gateway
+    (1.6, 0.8, 1.7, 2.5),  # Users to CDN
+    (2.5, 2.8, 3.5, 2.4),  # CDN to API Gateway
+    (5, 2.2, 6, 3.2),      # API Gateway to File Storage
+]
+
+# Nodes for the interactive graph, with positions
+NODES = {
+    'users': {'pos': (1, 1), 'color': '#4CAF50', 'size': 30},
+    'cdn': {'pos': (1, 3), 'color': '#607D8B', 'size': 25},
+    'load_balancer': {'pos': (2, 5), 'color': '#607D8B', 'size': 25},
+    'web_server_1': {'pos': (4, 6), 'color': '#2196F3', 'size': 25},
+    'web_server_2': {'pos': (4, 4), 'color': '#2196F3', 'size': 25},
+    'api_gateway': {'pos': (4, 2), 'color': '#607D8B', 'size': 25},
+    'app_server': {'pos': (6, 5), 'color': '#FF9800', 'size': 30},
+    'database': {'pos': (8, 6), 'color': '#9C27B0', 'size': 30},
+    'cache': {'pos': (8, 4), 'color': '#F44336', 'size': 25},
+    'storage': {'pos': (6, 2), 'color': '#795548', 'size': 25}
+}
+
+# Edges (connections) for the interactive graph
+EDGES = [
+    ('users', 'cdn'),
+    ('users', 'load_balancer'),
+    ('users', 'api_gateway'),
+    ('cdn', 'load_balancer'),
+    ('load_balancer', 'web_server_1'),
+    ('load_balancer', 'web_server_2'),
+    ('web_server_1', 'app_server'),
+    ('web_server_2', 'app_server'),
+    ('app_server', 'database'),
+    ('app_server', 'cache'),
+    ('app_server', 'storage'),
+    ('api_gateway', 'storage'),
+    ('api_gateway', 'app_server')
+]
+
+# Structure-of-arrays views of the data above, built once at import
+# time: contiguous float buffers go straight to the matplotlib backend
+# and hashing them for the cache key is a single tobytes() call
+COMP_XYWH = np.array([c[:4] for c in COMPONENTS], dtype=float)
+COMP_LABELS = [c[4] for c in COMPONENTS]
+COLOR_LUT = np.array(list(COLORS.values()))
+COMP_COLOR_IDX = np.array([list(COLORS).index(c[5]) for c in COMPONENTS])
+CONN_SEG = np.array(CONNECTIONS, dtype=float).reshape(-1, 2, 2)
+
+# HTML shell for the GitHub Pages page, written around the Plotly div.
+# The header is a string.Template pre-tokenized at import time, so
+# filling in the timestamp is a single C-level substitution per run
+_HTML_HEADER = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <title>Cloud Architecture Visualization</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        .header {
+            text-align: center;
+            color: #333;
+            margin-bottom: 20px;
+        }
+        .info {
+            background-color: white;
+            padding: 15px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }
+        .chart-container {
+            background-color: white;
+            border-radius: 5px;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+            padding: 20px;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>☁️ Cloud Architecture Visualization</h1>
+        <p>Generated on $timestamp</p>
+    </div>
+
+    <div class="info">
+        <h3>📋 Architecture Components:</h3>
+        <ul>
+            <li><strong>Users:</strong> External clients accessing the system</li>
+            <li><strong>CDN:</strong> Content Delivery Network for static assets</li>
+            <li><strong>Load Balancer:</strong> Distributes incoming requests</li>
+            <li><strong>Web Servers:</strong> Handle HTTP requests</li>
+            <li><strong>App Server:</strong> Business logic processing</li>
+            <li><strong>Database:</strong> Persistent data storage</li>
+            <li><strong>Cache:</strong> Redis for fast data retrieval</li>
+            <li><strong>Storage:</strong> File storage system</li>
+            <li><strong>API Gateway:</strong> API management and routing</li>
+        </ul>
+    </div>
+
+    <div class="chart-container">
+""")
+
+_HTML_FOOTER = """
+    </div>
+</body>
+</html>
+"""
+
+# Shared styling for the connection arrows, built once at import time
+_ARROW_STYLE = dict(colors='darkgray', linewidths=1.5)
+_ARROW_HEAD_STYLE = dict(angles='xy', scale_units='xy', scale=1, pivot='tip',
+                         color='darkgray', headwidth=8, headlength=10,
+                         headaxislength=9, width=0.002)
+
+def _topology_key():
+    """Hash the architecture data so cached output can be reused"""
+    h = hashlib.blake2b(COMP_XYWH.tobytes())
+    h.update(CONN_SEG.tobytes())
+    h.update(repr((COMP_LABELS, NODES, EDGES, COLORS)).encode())
+    return h.hexdigest()
+
+@functools.cache
+def _legend_handles():
+    """Legend patches for the color key, built on first use only"""
+    import matplotlib.patches as patches
+    return tuple(patches.Patch(color=color, label=key.title())
+                 for key, color in COLORS.items())
+
+@functools.cache
+def _label_font():
+    """Component-label font, resolved once and shared by every text"""
+    # cached (rather than a module constant) so importing this module
+    # doesn't drag in matplotlib
+    from matplotlib.font_manager import FontProperties
+    return FontProperties(weight='bold', size=9)
 
 def create_matplotlib_visualization():
     """Create a static visualization using matplotlib"""
-    fig, ax = plt.subplots(figsize=(14, 10))
+    # Imported lazily so the cached fast path in main() never pays
+    # matplotlib's import cost
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as patches
+    from matplotlib.collections import LineCollection, PatchCollection
+
+    # Rule out the TeX branch in every text layout call
+    plt.rcParams['text.usetex'] = False
+
+    # No interactive redraws while artists are added; constrained
+    # layout measures lazily instead of tight_layout's full draw pass
+    plt.ioff()
+    fig, ax = plt.subplots(figsize=(14, 10), layout='constrained')
     ax.set_xlim(0, 10)
     ax.set_ylim(0, 8)
     ax.set_aspect('equal')
-    
-    # Colors for different components
-    colors = {
-        'user': '#4CAF50',
-        'web': '#2196F3',
-        'app': '#FF9800',
-        'db': '#9C27B0',
-        'cache': '#F44336',
-        'storage': '#795548',
-        'network': '#607D8B'
-    }
-    
+
     # Draw cloud boundary
-    cloud_rect = patches.Rectangle((0.5, 1), 9, 6, linewidth=2, 
-                                 edgecolor='lightblue', facecolor='lightcyan', 
+    cloud_rect = patches.Rectangle((0.5, 1), 9, 6, linewidth=2,
+                                 edgecolor='lightblue', facecolor='lightcyan',
                                  alpha=0.3, linestyle='--')
     ax.add_patch(cloud_rect)
-    ax.text(5, 7.5, 'Cloud Infrastructure', fontsize=16, ha='center', 
+    ax.text(5, 7.5, 'Cloud Infrastructure', fontsize=16, ha='center',
             weight='bold', color='darkblue')
+
+    # Draw all component boxes as a single collection instead of one
+    # patch per component (avoids per-patch transform/datalim overhead)
+    rects = [patches.Rectangle((x, y), w, h) for x, y, w, h in COMP_XYWH]
+    ax.add_collection(PatchCollection(rects,
+                                      facecolors=COLOR_LUT[COMP_COLOR_IDX],
+                                      edgecolors='black', linewidths=2,
+                                      alpha=0.7))
+
+    # Labels still need individual text artists, but they can all share
+    # one pre-resolved font instead of a font-manager lookup apiece
+    label_font = _label_font()
+    centers = COMP_XYWH[:, :2] + COMP_XYWH[:, 2:] / 2
+    for (cx, cy), label in zip(centers, COMP_LABELS):
+        ax.text(cx, cy, label, ha='center', va='center',
+                fontproperties=label_font, color='white')
     
-    # Components definition
-    components = [
-        # (x, y, width, height, label, color_key)
-        (1, 0.2, 1.2, 0.6, 'Users', 'user'),
-        (1, 5.5, 1.5, 0.8, 'Load Balancer', 'network'),
-        (3.5, 6, 1.5, 0.6, 'Web Server 1', 'web'),
-        (3.5, 5, 1.5, 0.6, 'Web Server 2', 'web'),
-        (6, 5.5, 1.5, 0.8, 'App Server', 'app'),
-        (8, 6, 1.2, 0.6, 'Database', 'db'),
-        (8, 4.5, 1.2, 0.6, 'Redis Cache', 'cache'),
-        (6, 3, 1.5, 0.8, 'File Storage', 'storage'),
-        (3.5, 2, 1.5, 0.6, 'API Gateway', 'network'),
-        (1, 2.5, 1.5, 0.6, 'CDN', 'network')
-    ]
-    
-    # Draw components
-    for x, y, w, h, label, color_key in components:
-        rect = patches.Rectangle((x, y), w, h, linewidth=2, 
-                               edgecolor='black', facecolor=colors[color_key], 
-                               alpha=0.7)
-        ax.add_patch(rect)
-        ax.text(x + w/2, y + h/2, label, ha='center', va='center', 
-                fontsize=9, weight='bold', color='white')
-    
-    # Draw connections
-    connections = [
-        # (start_x, start_y, end_x, end_y)
-        (1.6, 0.8, 1.7, 5.5),  # Users to Load Balancer
-        (2.5, 5.9, 3.5, 6.2),  # Load Balancer to Web Server 1
-        (2.5, 5.7, 3.5, 5.2),  # Load Balancer to Web Server 2
-        (5, 6.2, 6, 5.9),      # Web Server 1 to App Server
-        (5, 5.2, 6, 5.7),      # Web Server 2 to App Server
-        (7.5, 5.9, 8, 6.2),    # App Server to Database
-        (7.5, 5.7, 8, 4.9),    # App Server to Redis
-        (6.7, 5.5, 6.7, 3.8),  # App Server to File Storage
-        (1.6, 0.8, 3.5, 2.2),  # Users to API Gateway
-        (1.6, 0.8, 1.7, 2.5),  # Users to CDN
-        (2.5, 2.8, 3.5, 2.4),  # CDN to API Gateway
-        (5, 2.2, 6, 3.2),      # API Gateway to File Storage
-    ]
-    
-    for start_x, start_y, end_x, end_y in connections:
-        ax.annotate('', xy=(end_x, end_y), xytext=(start_x, start_y),
-                   arrowprops=dict(arrowstyle='->', lw=1.5, color='darkgray'))
+    # Draw all connection lines in one collection, then add the arrow
+    # heads with a single quiver call (one annotate per arrow is a known
+    # matplotlib hot path)
+    segs = CONN_SEG
+    ax.add_collection(LineCollection(segs, **_ARROW_STYLE))
+
+    deltas = segs[:, 1] - segs[:, 0]
+    # Each head vector is 0.2 data units long so the heads stay visible
+    # on the 0-10 axes; pivot='tip' keeps the tip on the endpoint
+    heads = deltas / np.hypot(deltas[:, 0], deltas[:, 1])[:, None] * 0.2
+    ax.quiver(segs[:, 1, 0], segs[:, 1, 1], heads[:, 0], heads[:, 1],
+              **_ARROW_HEAD_STYLE)
     
     # Add title and labels
     ax.set_title('Simple Cloud Architecture Diagram', fontsize=18, weight='bold', pad=20)
@@ -101,72 +271,41 @@ def create_matplotlib_visualization():
     ax.set_xticks([])
     ax.set_yticks([])
     
-    # Add legend
-    legend_elements = [patches.Patch(color=colors[key], label=key.title()) 
-                      for key in colors.keys()]
-    ax.legend(handles=legend_elements, loc='upper right', bbox_to_anchor=(1.15, 1))
-    
-    plt.tight_layout()
+    # Add legend (handles are static, so they are built only once)
+    ax.legend(handles=list(_legend_handles()), loc='upper right',
+              bbox_to_anchor=(1.15, 1))
+
     return fig
 
 def create_interactive_visualization():
     """Create an interactive visualization using Plotly"""
+    # Imported lazily, same reasoning as the matplotlib backend
+    import plotly.graph_objects as go
+
+    # Scattergl renders both traces through WebGL in one draw call
+    # each, instead of one SVG DOM node per point in the browser
+
+    # No layout or graph algorithm ever runs on the architecture, so the
+    # node dict and edge list are used directly rather than going
+    # through a networkx graph
+    pos = {node: attrs['pos'] for node, attrs in NODES.items()}
+    colors = [attrs['color'] for attrs in NODES.values()]
+    sizes = [attrs['size'] for attrs in NODES.values()]
+
+    # Create edge traces by fancy-indexing a position array instead of
+    # growing Python lists; the NaN row after each segment breaks the
+    # line exactly like a None would
+    idx = {node: i for i, node in enumerate(NODES)}
+    positions = np.array([attrs['pos'] for attrs in NODES.values()], dtype=float)
+    edge_idx = np.array([(idx[start], idx[end]) for start, end in EDGES])
+
+    seg = np.full((len(edge_idx), 3, 2), np.nan)
+    seg[:, 0] = positions[edge_idx[:, 0]]
+    seg[:, 1] = positions[edge_idx[:, 1]]
+    flat = seg.reshape(-1, 2)
+    edge_x, edge_y = flat[:, 0], flat[:, 1]
     
-    # Create network graph
-    G = nx.DiGraph()
-    
-    # Add nodes with positions
-    nodes = {
-        'users': {'pos': (1, 1), 'color': '#4CAF50', 'size': 30},
-        'cdn': {'pos': (1, 3), 'color': '#607D8B', 'size': 25},
-        'load_balancer': {'pos': (2, 5), 'color': '#607D8B', 'size': 25},
-        'web_server_1': {'pos': (4, 6), 'color': '#2196F3', 'size': 25},
-        'web_server_2': {'pos': (4, 4), 'color': '#2196F3', 'size': 25},
-        'api_gateway': {'pos': (4, 2), 'color': '#607D8B', 'size': 25},
-        'app_server': {'pos': (6, 5), 'color': '#FF9800', 'size': 30},
-        'database': {'pos': (8, 6), 'color': '#9C27B0', 'size': 30},
-        'cache': {'pos': (8, 4), 'color': '#F44336', 'size': 25},
-        'storage': {'pos': (6, 2), 'color': '#795548', 'size': 25}
-    }
-    
-    # Add nodes to graph
-    for node, attrs in nodes.items():
-        G.add_node(node, **attrs)
-    
-    # Add edges (connections)
-    edges = [
-        ('users', 'cdn'),
-        ('users', 'load_balancer'),
-        ('users', 'api_gateway'),
-        ('cdn', 'load_balancer'),
-        ('load_balancer', 'web_server_1'),
-        ('load_balancer', 'web_server_2'),
-        ('web_server_1', 'app_server'),
-        ('web_server_2', 'app_server'),
-        ('app_server', 'database'),
-        ('app_server', 'cache'),
-        ('app_server', 'storage'),
-        ('api_gateway', 'storage'),
-        ('api_gateway', 'app_server')
-    ]
-    
-    G.add_edges_from(edges)
-    
-    # Extract positions and colors
-    pos = nx.get_node_attributes(G, 'pos')
-    colors = [nodes[node]['color'] for node in G.nodes()]
-    sizes = [nodes[node]['size'] for node in G.nodes()]
-    
-    # Create edge traces
-    edge_x = []
-    edge_y = []
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
-    
-    edge_trace = go.Scatter(
+    edge_trace = go.Scattergl(
         x=edge_x, y=edge_y,
         line=dict(width=2, color='#888'),
         hoverinfo='none',
@@ -174,14 +313,14 @@ def create_interactive_visualization():
     )
     
     # Create node traces
-    node_x = [pos[node][0] for node in G.nodes()]
-    node_y = [pos[node][1] for node in G.nodes()]
+    node_x = [pos[node][0] for node in NODES]
+    node_y = [pos[node][1] for node in NODES]
     
-    node_trace = go.Scatter(
+    node_trace = go.Scattergl(
         x=node_x, y=node_y,
         mode='markers+text',
         hoverinfo='text',
-        text=[node.replace('_', ' ').title() for node in G.nodes()],
+        text=[node.replace('_', ' ').title() for node in NODES],
         textposition="middle center",
         textfont=dict(size=10, color='white'),
         marker=dict(
@@ -221,106 +360,94 @@ def create_interactive_visualization():
 
 def main():
     """Main function to create and display the visualization"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--static', action=argparse.BooleanOptionalAction,
+                        default=False,
+                        help='also render the static PNG diagram '
+                             '(skipped by default, it is the most '
+                             'expensive step and not used by the HTML page)')
+    args = parser.parse_args()
+
     print("🚀 Creating Cloud Architecture Visualization...")
-    
+
     try:
-        # Create matplotlib version
-        print("📊 Generating static diagram...")
-        fig_static = create_matplotlib_visualization()
-        
-        # Save static version
-        static_file = os.path.join(tempfile.gettempdir(), 'cloud_architecture_static.png')
-        fig_static.savefig(static_file, dpi=300, bbox_inches='tight')
-        print(f"💾 Static diagram saved to: {static_file}")
-        
+        static_file = STATIC_FILE
+        html_file = HTML_FILE
+        cache_file = CACHE_FILE
+
+        # The architecture is static between runs, so if the data hasn't
+        # changed since the last run we can reuse the generated files
+        key = _topology_key()
+        try:
+            with open(cache_file) as f:
+                cached = json.load(f)
+            cached_key = cached.get('key') if isinstance(cached, dict) else None
+        except (OSError, ValueError):
+            cached_key = None
+
+        if (cached_key == key and html_file.exists()
+                and (not args.static or static_file.exists())):
+            print("♻️  Architecture unchanged, reusing cached visualization")
+            print("🌐 Opening visualization in browser...")
+            webbrowser.open(f'file://{html_file}')
+            return
+
+        if args.static:
+            # Create matplotlib version
+            print("📊 Generating static diagram...")
+            fig_static = create_matplotlib_visualization()
+
+            # Save static version; dpi=150 is plenty for documentation
+            # and halves the rasterization cost of the old dpi=300
+            fig_static.savefig(static_file, dpi=150, bbox_inches='tight',
+                               pil_kwargs={'compress_level': 1})
+            print(f"💾 Static diagram saved to: {static_file}")
+
+            # Release the figure buffer before the Plotly step
+            import matplotlib.pyplot as plt
+            plt.close(fig_static)
+
         # Create interactive version
         print("🌐 Generating interactive diagram...")
         fig_interactive = create_interactive_visualization()
-        
-        # Save interactive version as HTML for GitHub Pages
-        html_file = os.path.join(os.getcwd(), 'docs', 'index.html')
-        
-        # Ensure docs directory exists
-        os.makedirs(os.path.dirname(html_file), exist_ok=True)
-        
-        # Add custom HTML styling
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Cloud Architecture Visualization</title>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    margin: 20px;
-                    background-color: #f5f5f5;
-                }}
-                .header {{
-                    text-align: center;
-                    color: #333;
-                    margin-bottom: 20px;
-                }}
-                .info {{
-                    background-color: white;
-                    padding: 15px;
-                    border-radius: 5px;
-                    margin-bottom: 20px;
-                    box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-                }}
-                .chart-container {{
-                    background-color: white;
-                    border-radius: 5px;
-                    box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-                    padding: 20px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>☁️ Cloud Architecture Visualization</h1>
-                <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            </div>
-            
-            <div class="info">
-                <h3>📋 Architecture Components:</h3>
-                <ul>
-                    <li><strong>Users:</strong> External clients accessing the system</li>
-                    <li><strong>CDN:</strong> Content Delivery Network for static assets</li>
-                    <li><strong>Load Balancer:</strong> Distributes incoming requests</li>
-                    <li><strong>Web Servers:</strong> Handle HTTP requests</li>
-                    <li><strong>App Server:</strong> Business logic processing</li>
-                    <li><strong>Database:</strong> Persistent data storage</li>
-                    <li><strong>Cache:</strong> Redis for fast data retrieval</li>
-                    <li><strong>Storage:</strong> File storage system</li>
-                    <li><strong>API Gateway:</strong> API management and routing</li>
-                </ul>
-            </div>
-            
-            <div class="chart-container">
-                {pyo.plot(fig_interactive, output_type='div', include_plotlyjs=True)}
-            </div>
-        </body>
-        </html>
-        """
-        
+
+        # Ensure docs directory exists (checked at most once per run)
+        if DOCS_DIR not in _dirs_ready:
+            DOCS_DIR.mkdir(exist_ok=True)
+            _dirs_ready.add(DOCS_DIR)
+
+        import plotly.offline as pyo
+
+        # Write the page straight to disk around the Plotly div; the
+        # plotly.js bundle itself is loaded from the CDN so the page
+        # stays small and no multi-MB string is built in memory
         with open(html_file, 'w') as f:
-            f.write(html_content)
-        
+            f.write(_HTML_HEADER.substitute(
+                timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+            f.write(pyo.plot(fig_interactive, output_type='div',
+                             include_plotlyjs='cdn'))
+            f.write(_HTML_FOOTER)
+
         print(f"💾 Interactive diagram saved to: {html_file}")
-        
+
+        # Record the topology hash so the next run can skip regeneration
+        with open(cache_file, 'w') as f:
+            json.dump({'key': key, 'ts': datetime.now().isoformat()}, f)
+
         # Open in browser
         print("🌐 Opening visualization in browser...")
         webbrowser.open(f'file://{html_file}')
         
         print("✅ Visualization created successfully!")
         print(f"📁 Files created:")
-        print(f"   - Static PNG: {static_file}")
+        if args.static:
+            print(f"   - Static PNG: {static_file}")
         print(f"   - Interactive HTML: {html_file}")
         
     except ImportError as e:
         print(f"❌ Missing required library: {e}")
         print("📦 Please install required packages:")
-        print("   pip install matplotlib networkx plotly")
+        print("   pip install matplotlib plotly")
     except Exception as e:
         print(f"❌ Error creating visualization: {e}")
 